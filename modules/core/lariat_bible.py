@@ -9,6 +9,12 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+# Optional: faster JSON exports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import all modules
 from modules.menu.menu_item import MenuItem
 from modules.recipes.recipe import Recipe, Ingredient, RecipeIngredient
@@ -212,14 +218,16 @@ class LariatBible:
     
     def run_comprehensive_comparison(self) -> Dict:
         """Run full vendor comparison and generate recommendations"""
-        # Compare prices
+        # Compare prices once - the analysis, recommendations and export all reuse it
         comparison_df = self.order_guide_manager.compare_prices()
         
         # Get category analysis
-        category_analysis = self.order_guide_manager.get_category_analysis()
+        category_analysis = self.order_guide_manager.get_category_analysis(comparison_df)
         
         # Generate recommendations
-        recommendations = self.order_guide_manager.generate_purchase_recommendation()
+        recommendations = self.order_guide_manager.generate_purchase_recommendation(
+            comparison_df=comparison_df
+        )
         
         # Calculate impact on margins
         margin_impact = self.vendor_comparator.calculate_margin_impact(
@@ -231,7 +239,9 @@ class LariatBible:
             'category_analysis': category_analysis,
             'recommendations': recommendations,
             'margin_impact': margin_impact,
-            'export_status': self.order_guide_manager.export_comparison('data/vendor_comparison.xlsx')
+            'export_status': self.order_guide_manager.export_comparison(
+                'data/vendor_comparison.xlsx', comparison_df
+            )
         }
     
     # ========== MENU PRICING OPTIMIZATION ==========
@@ -246,15 +256,18 @@ class LariatBible:
                 target = self.target_catering_margin if menu_item.category == "Catering" else self.target_restaurant_margin
                 
                 if abs(current_margin - target) > 0.05:  # More than 5% off target
+                    # Evaluate the pricing properties once per item
+                    suggested_price = menu_item.suggested_price
+                    current_price = menu_item.menu_price
                     optimization_results.append({
                         'item': menu_item.name,
                         'category': menu_item.category,
-                        'current_price': menu_item.menu_price,
+                        'current_price': current_price,
                         'current_margin': current_margin,
                         'target_margin': target,
-                        'suggested_price': menu_item.suggested_price,
-                        'price_change': menu_item.suggested_price - menu_item.menu_price,
-                        'action': 'INCREASE' if menu_item.suggested_price > menu_item.menu_price else 'DECREASE'
+                        'suggested_price': suggested_price,
+                        'price_change': suggested_price - current_price,
+                        'action': 'INCREASE' if suggested_price > current_price else 'DECREASE'
                     })
         
         # Sort by biggest opportunity
@@ -442,12 +455,12 @@ class LariatBible:
         export_path.mkdir(parents=True, exist_ok=True)
         
         exports = {}
+        stamp = datetime.now().strftime('%Y%m%d')  # same date on every file in this export
         
         # Export menu items
         menu_data = [item.to_dict() for item in self.menu_items.values()]
-        menu_file = export_path / f"menu_items_{datetime.now().strftime('%Y%m%d')}.json"
-        with open(menu_file, 'w') as f:
-            json.dump(menu_data, f, indent=2, default=str)
+        menu_file = export_path / f"menu_items_{stamp}.json"
+        self._write_json(menu_file, menu_data)
         exports['menu'] = str(menu_file)
         
         # Export recipes
@@ -463,22 +476,33 @@ class LariatBible:
             }
             recipe_data.append(recipe_dict)
         
-        recipe_file = export_path / f"recipes_{datetime.now().strftime('%Y%m%d')}.json"
-        with open(recipe_file, 'w') as f:
-            json.dump(recipe_data, f, indent=2, default=str)
+        recipe_file = export_path / f"recipes_{stamp}.json"
+        self._write_json(recipe_file, recipe_data)
         exports['recipes'] = str(recipe_file)
         
         # Export vendor comparison
-        comparison_file = export_path / f"vendor_comparison_{datetime.now().strftime('%Y%m%d')}.xlsx"
+        comparison_file = export_path / f"vendor_comparison_{stamp}.xlsx"
         exports['vendor_comparison'] = self.order_guide_manager.export_comparison(str(comparison_file))
         
         # Export executive summary
-        summary_file = export_path / f"executive_summary_{datetime.now().strftime('%Y%m%d')}.txt"
+        summary_file = export_path / f"executive_summary_{stamp}.txt"
         with open(summary_file, 'w') as f:
             f.write(self.generate_executive_summary())
         exports['summary'] = str(summary_file)
         
         return exports
+    
+    @staticmethod
+    def _write_json(path: Path, data) -> None:
+        """Write an export file as indented JSON, using orjson when installed"""
+        if orjson is not None:
+            # Datetimes go through default=str, so they read the same as json.dump's
+            option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=option))
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
 
 
 # Create singleton instance
@@ -11,9 +11,21 @@ from typing import Dict, List, Optional
 import pandas as pd
 from dataclasses import dataclass
 
+# Optional: RE2 guarantees linear-time matching on arbitrary email bodies
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 @dataclass
 class OrderItem:
     """Single line item from order confirmation"""
+    # Explicit slots (dataclass(slots=True) needs 3.10) - no per-item __dict__
+    __slots__ = (
+        'vendor', 'order_number', 'date', 'item_code', 'description',
+        'pack_size', 'quantity_ordered', 'unit_price', 'extension'
+    )
+    
     vendor: str
     order_number: str
     date: datetime
@@ -28,6 +40,20 @@ class OrderItem:
     def normalized_unit_price(self) -> float:
         """Convert to price per unit based on pack size"""
         return normalize_pack_size(self.pack_size, self.unit_price)
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for DataFrame/export"""
+        return {
+            'vendor': self.vendor,
+            'order_number': self.order_number,
+            'date': self.date,
+            'item_code': self.item_code,
+            'description': self.description,
+            'pack_size': self.pack_size,
+            'quantity_ordered': self.quantity_ordered,
+            'unit_price': self.unit_price,
+            'extension': self.extension
+        }
 
 
 class PackSizeNormalizer:
@@ -43,6 +69,20 @@ class PackSizeNormalizer:
         '#303': 16,      # 16 oz
     }
     
+    # Every pack format in one pattern, compiled once at import. The
+    # alternatives are tried in order (cans, X/Y#, LB, GAL, case) and the
+    # outer group name tells parse_pack_size which one matched. Can sizes are
+    # listed longest first so '#2.5' wins over '#2'.
+    PACK_PATTERN = re.compile(
+        r'(?P<can>(?P<can_count>\d+)\s*/\s*(?P<can_size>'
+        + '|'.join(re.escape(size) for size in sorted(CAN_SIZES, key=len, reverse=True))
+        + r'))'
+        r'|(?P<pound>(?P<pound_count>\d+)\s*/\s*(?P<pound_size>\d+)\s*#)'
+        r'|(?P<lb>(?P<lb_size>\d+)\s*LB)'
+        r'|(?P<gal>(?P<gal_count>\d+)\s*/\s*(?P<gal_size>\d+)\s*GAL)'
+        r'|(?P<case>(?P<case_count>\d+)\s*/\s*(?P<case_unit>CS|CASE|EA|EACH))'
+    )
+    
     @staticmethod
     def parse_pack_size(pack_str: str) -> Dict:
         """
@@ -55,26 +95,25 @@ class PackSizeNormalizer:
         """
         pack_str = pack_str.upper().strip()
         
-        # Check for can sizes first
-        for can_size, ounces in PackSizeNormalizer.CAN_SIZES.items():
-            if can_size in pack_str:
-                # Found a can size
-                match = re.match(r'(\d+)\s*/\s*' + re.escape(can_size), pack_str)
-                if match:
-                    count = int(match.group(1))
-                    return {
-                        'count': count,
-                        'size': ounces,
-                        'unit': 'OZ',
-                        'total_ounces': count * ounces,
-                        'total_pounds': (count * ounces) / 16
-                    }
+        match = PackSizeNormalizer.PACK_PATTERN.match(pack_str)
+        kind = match.lastgroup if match else None
         
-        # Check for X/Y# pattern (pounds)
-        pound_match = re.match(r'(\d+)\s*/\s*(\d+)\s*#', pack_str)
-        if pound_match:
-            count = int(pound_match.group(1))
-            pounds = int(pound_match.group(2))
+        # Can sizes (#10, #5, ...)
+        if kind == 'can':
+            count = int(match.group('can_count'))
+            ounces = PackSizeNormalizer.CAN_SIZES[match.group('can_size')]
+            return {
+                'count': count,
+                'size': ounces,
+                'unit': 'OZ',
+                'total_ounces': count * ounces,
+                'total_pounds': (count * ounces) / 16
+            }
+        
+        # X/Y# pattern (pounds)
+        if kind == 'pound':
+            count = int(match.group('pound_count'))
+            pounds = int(match.group('pound_size'))
             return {
                 'count': count,
                 'size': pounds,
@@ -83,10 +122,9 @@ class PackSizeNormalizer:
                 'total_pounds': count * pounds
             }
         
-        # Check for simple pounds
-        lb_match = re.match(r'(\d+)\s*LB', pack_str)
-        if lb_match:
-            pounds = int(lb_match.group(1))
+        # Simple pounds
+        if kind == 'lb':
+            pounds = int(match.group('lb_size'))
             return {
                 'count': 1,
                 'size': pounds,
@@ -95,11 +133,10 @@ class PackSizeNormalizer:
                 'total_pounds': pounds
             }
         
-        # Check for gallons
-        gal_match = re.match(r'(\d+)\s*/\s*(\d+)\s*GAL', pack_str)
-        if gal_match:
-            count = int(gal_match.group(1))
-            gallons = int(gal_match.group(2))
+        # Gallons
+        if kind == 'gal':
+            count = int(match.group('gal_count'))
+            gallons = int(match.group('gal_size'))
             return {
                 'count': count,
                 'size': gallons,
@@ -108,14 +145,13 @@ class PackSizeNormalizer:
                 'total_pounds': None  # Liquid measure
             }
         
-        # Check for case/each
-        case_match = re.match(r'(\d+)\s*/\s*(CS|CASE|EA|EACH)', pack_str)
-        if case_match:
-            count = int(case_match.group(1))
+        # Case/each
+        if kind == 'case':
+            count = int(match.group('case_count'))
             return {
                 'count': count,
                 'size': 1,
-                'unit': case_match.group(2),
+                'unit': match.group('case_unit'),
                 'total_ounces': None,
                 'total_pounds': None
             }
@@ -131,21 +167,39 @@ class PackSizeNormalizer:
         }
     
     @staticmethod
-    def normalize_to_price_per_pound(pack_str: str, case_price: float) -> Optional[float]:
-        """Convert any pack size to price per pound"""
+    def pack_weight_in_pounds(pack_str: str) -> Optional[float]:
+        """Total weight of a pack in pounds, or None for non-weight packs"""
         parsed = PackSizeNormalizer.parse_pack_size(pack_str)
         
         if parsed['total_pounds']:
-            return case_price / parsed['total_pounds']
+            return parsed['total_pounds']
         elif parsed['total_ounces']:
-            return case_price / (parsed['total_ounces'] / 16)
+            return parsed['total_ounces'] / 16
         else:
-            return None  # Can't convert to per pound
+            return None  # Can't convert to pounds
+    
+    @staticmethod
+    def normalize_to_price_per_pound(pack_str: str, case_price: float) -> Optional[float]:
+        """Convert any pack size to price per pound"""
+        pounds = PackSizeNormalizer.pack_weight_in_pounds(pack_str)
+        return case_price / pounds if pounds else None
 
 
 class EmailOrderParser:
     """Parse order confirmations from email"""
     
+    # The line patterns run over whole (untrusted) email bodies, where the
+    # lazy description group can backtrack heavily on near-miss lines - use
+    # RE2 for them when it is installed
+    _LINE_ENGINE = re2 if re2 is not None else re
+    
+    # SYSCO format: "123456  PEPPER BLACK GROUND  6/1#  2  $45.99  $91.98"
+    SYSCO_LINE_PATTERN = _LINE_ENGINE.compile(r'(\d{6,7})\s+(.+?)\s+(\S+)\s+(\d+)\s+\$?([\d.]+)\s+\$?([\d.]+)')
+    # Shamrock format - adjust based on actual Shamrock email format
+    SHAMROCK_LINE_PATTERN = _LINE_ENGINE.compile(r'(\d+)\s+(.+?)\s+(\S+)\s+(\d+)\s+\$?([\d.]+)\s+\$?([\d.]+)')
+    SYSCO_ORDER_PATTERN = re.compile(r'Order\s*#?\s*:?\s*(\d+)', re.IGNORECASE)
+    SHAMROCK_ORDER_PATTERN = re.compile(r'Confirmation\s*#?\s*:?\s*(\d+)', re.IGNORECASE)
+    
     def __init__(self, email_address: str, password: str, imap_server: str = "imap.gmail.com"):
         self.email_address = email_address
         self.password = password
@@ -162,15 +216,15 @@ class EmailOrderParser:
         """Parse SYSCO order confirmation email"""
         items = []
         
-        # SYSCO format patterns
-        # Look for lines like: "123456  PEPPER BLACK GROUND  6/1#  2  $45.99  $91.98"
-        pattern = r'(\d{6,7})\s+(.+?)\s+(\S+)\s+(\d+)\s+\$?([\d.]+)\s+\$?([\d.]+)'
+        # Same for every line - look it up once rather than rescanning the body per item
+        order_number = self._extract_order_number(email_body, 'SYSCO')
+        order_date = datetime.now()
         
-        for match in re.finditer(pattern, email_body):
+        for match in self.SYSCO_LINE_PATTERN.finditer(email_body):
             item = OrderItem(
                 vendor='SYSCO',
-                order_number=self._extract_order_number(email_body, 'SYSCO'),
-                date=datetime.now(),
+                order_number=order_number,
+                date=order_date,
                 item_code=match.group(1),
                 description=match.group(2).strip(),
                 pack_size=match.group(3),
@@ -186,15 +240,15 @@ class EmailOrderParser:
         """Parse Shamrock Foods order confirmation email"""
         items = []
         
-        # Shamrock format patterns
-        # Adjust based on actual Shamrock email format
-        pattern = r'(\d+)\s+(.+?)\s+(\S+)\s+(\d+)\s+\$?([\d.]+)\s+\$?([\d.]+)'
+        # Same for every line - look it up once rather than rescanning the body per item
+        order_number = self._extract_order_number(email_body, 'Shamrock')
+        order_date = datetime.now()
         
-        for match in re.finditer(pattern, email_body):
+        for match in self.SHAMROCK_LINE_PATTERN.finditer(email_body):
             item = OrderItem(
                 vendor='Shamrock Foods',
-                order_number=self._extract_order_number(email_body, 'Shamrock'),
-                date=datetime.now(),
+                order_number=order_number,
+                date=order_date,
                 item_code=match.group(1),
                 description=match.group(2).strip(),
                 pack_size=match.group(3),
@@ -209,12 +263,24 @@ class EmailOrderParser:
     def _extract_order_number(self, email_body: str, vendor: str) -> str:
         """Extract order number from email"""
         if vendor == 'SYSCO':
-            match = re.search(r'Order\s*#?\s*:?\s*(\d+)', email_body, re.IGNORECASE)
+            match = self.SYSCO_ORDER_PATTERN.search(email_body)
         else:  # Shamrock
-            match = re.search(r'Confirmation\s*#?\s*:?\s*(\d+)', email_body, re.IGNORECASE)
+            match = self.SHAMROCK_ORDER_PATTERN.search(email_body)
         
         return match.group(1) if match else 'UNKNOWN'
     
+    def _fetch_bodies(self, email_ids: List[bytes]) -> List[str]:
+        """Fetch several messages in one IMAP round trip instead of one per email"""
+        if not email_ids:
+            return []
+        
+        status, data = self.mail.fetch(b','.join(email_ids).decode(), '(RFC822)')
+        if status != 'OK':
+            return []
+        
+        # Each message comes back as a (header, body) tuple followed by b')'
+        return [part[1].decode('utf-8') for part in data if isinstance(part, tuple)]
+    
     def fetch_recent_orders(self, days_back: int = 7) -> pd.DataFrame:
         """Fetch and parse recent order confirmation emails"""
         from datetime import timedelta
@@ -229,35 +295,30 @@ class EmailOrderParser:
             f'(FROM "sysco.com" SINCE {date_criteria} SUBJECT "order")')
         
         if status == 'OK':
-            for email_id in sysco_ids[0].split():
-                status, data = self.mail.fetch(email_id, '(RFC822)')
-                if status == 'OK':
-                    email_body = data[0][1].decode('utf-8')
-                    items = self.parse_sysco_email(email_body)
-                    all_items.extend(items)
+            for email_body in self._fetch_bodies(sysco_ids[0].split()):
+                items = self.parse_sysco_email(email_body)
+                all_items.extend(items)
         
         # Search Shamrock emails
         status, shamrock_ids = self.mail.search(None,
             f'(FROM "shamrockfoods.com" SINCE {date_criteria} SUBJECT "confirmation")')
         
         if status == 'OK':
-            for email_id in shamrock_ids[0].split():
-                status, data = self.mail.fetch(email_id, '(RFC822)')
-                if status == 'OK':
-                    email_body = data[0][1].decode('utf-8')
-                    items = self.parse_shamrock_email(email_body)
-                    all_items.extend(items)
+            for email_body in self._fetch_bodies(shamrock_ids[0].split()):
+                items = self.parse_shamrock_email(email_body)
+                all_items.extend(items)
         
         # Convert to DataFrame
         if all_items:
-            df = pd.DataFrame([vars(item) for item in all_items])
+            df = pd.DataFrame([item.to_dict() for item in all_items])
             
-            # Add normalized price per pound
-            df['price_per_pound'] = df.apply(
-                lambda row: self.normalizer.normalize_to_price_per_pound(
-                    row['pack_size'], row['unit_price']
-                ), axis=1
-            )
+            # Add normalized price per pound - orders repeat the same pack
+            # sizes, so parse each distinct one once and divide column-wise
+            weights = {
+                pack: self.normalizer.pack_weight_in_pounds(pack)
+                for pack in df['pack_size'].unique()
+            }
+            df['price_per_pound'] = df['unit_price'] / df['pack_size'].map(weights).astype(float)
             
             return df
         else:
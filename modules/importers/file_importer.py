@@ -4,24 +4,94 @@ Import data from CSV, Excel, and Google Sheets
 No API needed - just upload files!
 """
 
+import csv
+import functools
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from collections import Counter
 from datetime import datetime
 import numpy as np
 import os
 
+# The pyarrow CSV engine parses ISO dates into datetime.date, which would leak
+# into imported records (order_date, event_date...), so the C parser is the
+# default; pass csv_engine='pyarrow' for typed columns
+CSV_ENGINE = 'c'
+
+# Optional faster readers/writers - fall back to pandas defaults when missing
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_required(columns: tuple) -> frozenset:
+    """Normalized required column names (cached - importers reuse the same lists)"""
+    return frozenset(col.lower().replace(' ', '_') for col in columns)
+
 
 class FileImporter:
     """Import data from various file formats"""
 
-    def __init__(self):
-        self.supported_formats = ['.csv', '.xlsx', '.xls', '.ods']
+    # Extension -> pandas reader(importer, path, sheet_name)
+    _READERS = {
+        '.csv': lambda self, path, sheet: pd.read_csv(path, engine=self.csv_engine),
+        '.xlsx': lambda self, path, sheet: pd.read_excel(path, engine=self.excel_engine, sheet_name=sheet or 0),
+        '.xls': lambda self, path, sheet: pd.read_excel(path, engine=self.excel_engine, sheet_name=sheet or 0),
+        '.ods': lambda self, path, sheet: pd.read_excel(path, engine=self.excel_engine or 'odf', sheet_name=sheet or 0)
+    }
+
+    def __init__(
+        self,
+        csv_engine: str = CSV_ENGINE,
+        excel_engine: Optional[str] = EXCEL_ENGINE,
+        backend: str = 'pandas'
+    ):
+        """
+        Args:
+            csv_engine: pandas CSV parser ('c', or 'pyarrow' for a
+                multi-threaded parse that also types date columns)
+            excel_engine: pandas Excel reader ('calamine' when installed,
+                else None to let pandas pick openpyxl/xlrd/odf)
+            backend: 'pandas' or 'polars' - parse/transform engine for
+                vendor order guide imports
+        """
+        if backend not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown backend: {backend}. Use 'pandas' or 'polars'")
+        if backend == 'polars' and pl is None:
+            raise ImportError("polars is required for backend='polars' - pip install polars")
+
+        self.supported_formats = frozenset(self._READERS)
+        self.csv_engine = csv_engine
+        self.excel_engine = excel_engine
+        self.backend = backend
         self.import_history = []
 
     # ==================== CORE IMPORT FUNCTIONS ====================
 
-    def read_file(self, file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def read_file(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        clean: bool = True,
+        diet: bool = False
+    ) -> pd.DataFrame:
         """
         Read file and return DataFrame
         Automatically detects file format
@@ -29,10 +99,104 @@ class FileImporter:
         Args:
             file_path: Path to file
             sheet_name: Sheet name for Excel files (default: first sheet)
+            clean: Drop rows where every cell is empty (e.g. ',,,' rows left
+                by spreadsheet exports). Blank CSV lines are always skipped
+                by the parser; pass False to skip the extra scan for files
+                known to be tidy.
+            diet: Shrink column dtypes (see _diet). Only worth it when the
+                frame is kept around - the importers convert every column.
 
         Returns:
             pandas DataFrame with cleaned column names
         """
+        file_path, ext = self._check_file(file_path)
+
+        # Read based on format
+        df = self._READERS[ext](self, file_path, sheet_name)
+        df = self._clean_frame(df, drop_empty=clean)
+
+        return self._diet(df) if diet else df
+
+    def read_file_chunks(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        chunksize: int = 50_000,
+        clean: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read file in chunks of at most chunksize rows
+
+        Each chunk is cleaned like read_file and keeps the file's row
+        numbers in its index.
+
+        Args:
+            file_path: Path to file
+            sheet_name: Sheet name for Excel files (default: first sheet)
+            chunksize: Maximum rows per chunk
+            clean: Drop rows where every cell is empty (see read_file)
+
+        Yields:
+            pandas DataFrames with cleaned column names
+        """
+        file_path, ext = self._check_file(file_path)
+
+        if ext == '.csv':
+            # The pyarrow engine cannot chunk - the C parser streams rows.
+            # Blank lines are kept (and dropped with the other empty rows)
+            # so the index stays the file line, as for Excel sheets.
+            chunks = pd.read_csv(file_path, chunksize=chunksize, skip_blank_lines=not clean)
+            drop_empty = clean
+        elif self.excel_engine == 'calamine':
+            # Empty rows are skipped while batching, no scan needed afterwards
+            chunks = self._calamine_chunks(file_path, sheet_name, chunksize, skip_empty=clean)
+            drop_empty = False
+        else:
+            # No streaming Excel reader available - load once and slice
+            df = self.read_file(file_path, sheet_name, clean=clean)
+            for start in range(0, max(len(df), 1), chunksize):
+                yield df.iloc[start:start + chunksize]
+            return
+
+        for chunk in chunks:
+            yield self._clean_frame(chunk, drop_empty=drop_empty)
+
+    def read_file_polars(self, file_path: str, sheet_name: Optional[str] = None) -> 'pl.DataFrame':
+        """
+        Read file into a polars DataFrame
+
+        Column names are cleaned like read_file, every column is text and
+        fully empty rows are dropped; a '_row' column keeps each row's
+        position in the file.
+        """
+        file_path, ext = self._check_file(file_path)
+
+        # Every column is read as text - polars guesses types from the first
+        # rows only, so a late 'ABC12' code or 'call' price would otherwise
+        # fail the read or turn into null. _vendor_products_polars casts.
+        if ext == '.csv':
+            df = pl.read_csv(file_path, infer_schema_length=0)
+        else:
+            # Keep empty rows until '_row' is numbered so it matches the sheet
+            df = pl.read_excel(
+                file_path,
+                sheet_name=sheet_name,
+                engine='calamine',
+                infer_schema_length=0,
+                drop_empty_rows=False
+            )
+
+        # Clean column names (remove spaces, lowercase)
+        df = df.rename({col: col.strip().lower().replace(' ', '_') for col in df.columns})
+
+        # Remove empty rows
+        return (
+            df.with_row_index('_row')
+            .filter(~pl.all_horizontal(pl.exclude('_row').is_null()))
+        )
+
+    def _check_file(self, file_path: str):
+        """Return (Path, extension) for a readable, supported file"""
         file_path = Path(file_path)
 
         if not file_path.exists():
@@ -42,21 +206,87 @@ class FileImporter:
         ext = file_path.suffix.lower()
 
         if ext not in self.supported_formats:
-            raise ValueError(f"Unsupported file format: {ext}. Supported: {self.supported_formats}")
+            raise ValueError(f"Unsupported file format: {ext}. Supported: {sorted(self.supported_formats)}")
+
+        return file_path, ext
+
+    @staticmethod
+    def _calamine_chunks(
+        file_path: Path,
+        sheet_name: Optional[str],
+        chunksize: int,
+        skip_empty: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """Stream an Excel/ODS sheet through calamine's row iterator"""
+        workbook = python_calamine.CalamineWorkbook.from_path(str(file_path))
+        sheet = workbook.get_sheet_by_name(sheet_name) if sheet_name else workbook.get_sheet_by_index(0)
+        rows = sheet.iter_rows()
+
+        header = next(rows, [])
+        batch = []
+        positions = []
+        yielded = False
+
+        for position, row in enumerate(rows):
+            # calamine reports empty cells as ''
+            if skip_empty and all(cell == '' for cell in row):
+                continue
+
+            batch.append(row)
+            positions.append(position)
+            if len(batch) == chunksize:
+                yield FileImporter._calamine_frame(batch, header, positions)
+                yielded = True
+                batch = []
+                positions = []
+
+        if batch or not yielded:
+            yield FileImporter._calamine_frame(batch, header, positions)
+
+    @staticmethod
+    def _calamine_frame(rows: List[List], header: List, positions: List[int]) -> pd.DataFrame:
+        """Build a chunk DataFrame indexed by sheet row position"""
+        df = pd.DataFrame(rows, columns=[str(c) for c in header], index=pd.Index(positions, dtype='int64'))
+        return df.where(df != '')
+
+    @staticmethod
+    def _clean_frame(df: pd.DataFrame, drop_empty: bool = True) -> pd.DataFrame:
+        """Normalize column names and (optionally) drop fully empty rows"""
+        # Clean column names (remove spaces, lowercase) in a single pass
+        df.columns = [str(col).strip().lower().replace(' ', '_') for col in df.columns]
 
-        # Read based on format
-        if ext == '.csv':
-            df = pd.read_csv(file_path)
-        elif ext in ['.xlsx', '.xls']:
-            df = pd.read_excel(file_path, sheet_name=sheet_name or 0)
-        elif ext == '.ods':
-            df = pd.read_excel(file_path, engine='odf', sheet_name=sheet_name or 0)
+        # Remove empty rows
+        if drop_empty:
+            df = df.dropna(how='all')
 
-        # Clean column names (remove spaces, lowercase)
-        df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+        return df
 
-        # Remove empty rows
-        df = df.dropna(how='all')
+    @staticmethod
+    def _diet(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Shrink column dtypes to cut memory for frames that are kept
+
+        - Integers are downcast to the smallest type that holds them
+        - Floats are downcast to float32 only when no value changes
+          (prices like 45.99 stay float64)
+        - Text columns with many repeats (pack size, unit, category...)
+          become pandas categoricals
+        """
+        df = df.copy()
+
+        for column in df.columns:
+            values = df[column]
+
+            if pd.api.types.is_integer_dtype(values):
+                df[column] = pd.to_numeric(values, downcast='integer')
+
+            elif pd.api.types.is_float_dtype(values):
+                smaller = pd.to_numeric(values, downcast='float')
+                if np.array_equal(smaller.to_numpy(np.float64), values.to_numpy(np.float64), equal_nan=True):
+                    df[column] = smaller
+
+            elif pd.api.types.is_string_dtype(values) and len(values) and values.nunique() / len(values) < 0.5:
+                df[column] = values.astype('category')
 
         return df
 
@@ -71,12 +301,11 @@ class FileImporter:
         Returns:
             Dict with validation results
         """
-        # Normalize column names
-        df_cols = set(df.columns)
-        required = set(col.lower().replace(' ', '_') for col in required_columns)
+        df_cols = frozenset(df.columns)
+        required = _normalize_required(tuple(required_columns))
 
-        missing = required - df_cols
-        extra = df_cols - required
+        missing = set(required - df_cols)
+        extra = set(df_cols - required)
 
         return {
             'valid': len(missing) == 0,
@@ -85,6 +314,85 @@ class FileImporter:
             'message': f"Missing columns: {missing}" if missing else "All required columns present"
         }
 
+    # ==================== COLUMN HELPERS ====================
+
+    @staticmethod
+    def _text_column(
+        df: pd.DataFrame,
+        column: str,
+        default: str = '',
+        upper: bool = False,
+        strip: bool = True
+    ) -> pd.Series:
+        """
+        Convert a column to text in one vectorized pass
+
+        Missing cells (or a missing column) are filled with default
+        """
+        if column not in df.columns:
+            return pd.Series(default, index=df.index, dtype=object)
+
+        values = df[column].astype(str)
+        if strip:
+            values = values.str.strip()
+        if upper:
+            values = values.str.upper()
+
+        return values.where(df[column].notna(), default).astype(object)
+
+    @staticmethod
+    def _code_column(df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Convert an item code column to text
+
+        Numeric codes are read as floats whenever the column has a blank
+        cell (or always, from calamine), so whole-number floats are written
+        without the trailing '.0' - '1001', not '1001.0'
+        """
+        values = FileImporter._text_column(df, column)
+        if column not in df.columns:
+            return values
+
+        raw = df[column]
+        if pd.api.types.is_float_dtype(raw):
+            is_float = raw.notna()
+        elif pd.api.types.is_object_dtype(raw):
+            is_float = raw.map(lambda value: isinstance(value, float))
+        else:
+            return values
+
+        numbers = raw.where(is_float).astype(float)
+        whole = is_float & np.isfinite(numbers) & (numbers == numbers.round())
+        if whole.any():
+            values = values.copy()
+            values[whole] = numbers[whole].astype('int64').astype(str).astype(object)
+
+        return values
+
+    @staticmethod
+    def _number_column(df: pd.DataFrame, column: str, default=None) -> pd.Series:
+        """
+        Convert a column to floats in one vectorized pass
+
+        Missing or non-numeric cells (or a missing column) are filled with default
+        """
+        if column not in df.columns:
+            return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+        values = pd.to_numeric(df[column], errors='coerce').astype(float)
+
+        return values.astype(object).where(values.notna(), default)
+
+    @staticmethod
+    def _extension_mismatches(
+        quantity: np.ndarray,
+        unit_price: np.ndarray,
+        extension: np.ndarray,
+        tolerance: float = 0.01
+    ) -> np.ndarray:
+        """Boolean mask of lines where quantity × unit_price is more than a cent off the extension"""
+        return ~np.isclose(quantity * unit_price, extension, rtol=0, atol=tolerance)
+
     # ==================== VENDOR ORDER GUIDE IMPORT ====================
 
     def import_vendor_order_guide(
@@ -92,7 +400,9 @@ class FileImporter:
         file_path: str,
         vendor: str,
         sheet_name: Optional[str] = None,
-        validate_only: bool = False
+        validate_only: bool = False,
+        as_dicts: Optional[bool] = True,
+        output_path: Optional[str] = None
     ) -> Dict:
         """
         Import vendor order guide from CSV or Excel
@@ -102,89 +412,266 @@ class FileImporter:
             vendor: 'SYSCO' or 'Shamrock Foods'
             sheet_name: Sheet name for Excel files
             validate_only: If True, only validate, don't import
+            as_dicts: If True, return products as a list of dicts;
+                if False, return them as a pyarrow Table ('products_table');
+                if None, keep no products (only write output_path)
+            output_path: Optional Parquet file to write the products to
 
         Returns:
             Dict with import results
         """
-        print(f"📁 Importing {vendor} order guide from {file_path}")
+        if (as_dicts is False or output_path) and pa is None:
+            raise ImportError("pyarrow is required for Arrow/Parquet output - pip install pyarrow")
 
-        # Read file
-        df = self.read_file(file_path, sheet_name)
+        print(f"📁 Importing {vendor} order guide from {file_path}")
 
         # Required columns
         required = ['item_code', 'description', 'pack_size', 'case_price']
 
-        # Validate
-        validation = self.validate_columns(df, required)
+        if self.backend == 'polars':
+            df = self.read_file_polars(file_path, sheet_name)
 
-        if not validation['valid']:
-            return {
-                'success': False,
-                'error': validation['message'],
-                'missing_columns': validation['missing_columns']
-            }
+            validation = self.validate_columns(df, required)
 
-        if validate_only:
-            return {
-                'success': True,
-                'message': 'Validation passed',
-                'rows': len(df)
-            }
-
-        # Process each row
-        products = []
-        errors = []
+            if not validation['valid']:
+                return {
+                    'success': False,
+                    'error': validation['message'],
+                    'missing_columns': validation['missing_columns']
+                }
 
-        for idx, row in df.iterrows():
-            try:
-                product = {
-                    'vendor': vendor,
-                    'item_code': str(row['item_code']).strip(),
-                    'description': str(row['description']).strip().upper(),
-                    'pack_size': str(row['pack_size']).strip(),
-                    'case_price': float(row['case_price']),
-                    'unit_price': float(row.get('unit_price', 0)) if 'unit_price' in row and pd.notna(row.get('unit_price')) else None,
-                    'unit': str(row.get('unit', 'EACH')).strip().upper() if 'unit' in row and pd.notna(row.get('unit')) else 'EACH',
-                    'category': str(row.get('category', 'UNCATEGORIZED')).strip().upper() if 'category' in row and pd.notna(row.get('category')) else 'UNCATEGORIZED',
-                    'last_updated': datetime.now()
+            if validate_only:
+                return {
+                    'success': True,
+                    'message': 'Validation passed',
+                    'rows': df.height
                 }
 
-                # Validate price
-                if product['case_price'] <= 0:
-                    errors.append(f"Row {idx+2}: Invalid price ${product['case_price']}")
-                    continue
+            orders, errors = self._vendor_products_polars(
+                df, vendor, numeric_codes=Path(file_path).suffix.lower() == '.csv'
+            )
+            total_rows = df.height
+            imported = orders.height
+            products = orders.to_dicts() if as_dicts else None
+            # polars writes large_string columns - cast to the pandas path's schema
+            table = orders.to_arrow().cast(self._products_schema()) if (as_dicts is False or output_path) else None
 
-                products.append(product)
+            if output_path:
+                pq.write_table(table, output_path, compression='zstd')
 
-            except Exception as e:
-                errors.append(f"Row {idx+2}: {str(e)}")
+        else:
+            products = []
+            frames = []
+            errors = []
+            total_rows = 0
+            imported = 0
+            writer = None
+
+            # Read in chunks - Parquet output is written chunk by chunk, and
+            # products are only kept in memory in the forms asked for
+            try:
+                for chunk_number, df in enumerate(self.read_file_chunks(file_path, sheet_name)):
+                    # Validate (column names are the same in every chunk)
+                    if chunk_number == 0:
+                        validation = self.validate_columns(df, required)
+
+                        if not validation['valid']:
+                            return {
+                                'success': False,
+                                'error': validation['message'],
+                                'missing_columns': validation['missing_columns']
+                            }
+
+                    total_rows += len(df)
+
+                    if validate_only:
+                        continue
+
+                    orders, chunk_errors = self._vendor_products(df, vendor)
+                    errors.extend(chunk_errors)
+                    imported += len(orders)
+
+                    if as_dicts:
+                        products.extend(orders.to_dict('records'))
+                    elif as_dicts is False:
+                        frames.append(orders)
+
+                    if output_path:
+                        chunk_table = self._products_table(orders)
+                        if writer is None:
+                            writer = pq.ParquetWriter(output_path, chunk_table.schema, compression='zstd')
+                        writer.write_table(chunk_table)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            if validate_only:
+                return {
+                    'success': True,
+                    'message': 'Validation passed',
+                    'rows': total_rows
+                }
+
+            # Columnar output - no per-row Python objects
+            table = self._products_table(pd.concat(frames)) if frames else None
 
         # Save to database or return results
         result = {
             'success': True,
             'vendor': vendor,
-            'total_rows': len(df),
-            'products_imported': len(products),
+            'total_rows': total_rows,
+            'products_imported': imported,
             'errors': errors,
-            'error_count': len(errors),
-            'products': products
+            'error_count': len(errors)
         }
 
+        if as_dicts:
+            result['products'] = products
+        elif as_dicts is False:
+            result['products_table'] = table
+
+        if output_path:
+            result['output_path'] = output_path
+
         # Record import
         self.import_history.append({
             'timestamp': datetime.now(),
             'type': 'vendor_order_guide',
             'vendor': vendor,
             'file': str(file_path),
-            'rows_imported': len(products)
+            'rows_imported': imported
         })
 
-        print(f"✅ Imported {len(products)} products")
+        print(f"✅ Imported {imported} products")
         if errors:
             print(f"⚠️  {len(errors)} errors occurred")
 
         return result
 
+    def _vendor_products(self, df: pd.DataFrame, vendor: str):
+        """
+        Convert one chunk of an order guide into products
+
+        Returns:
+            (products DataFrame, errors) for the rows in df
+        """
+        # Transform whole columns at once instead of row by row
+        case_price = pd.to_numeric(df['case_price'], errors='coerce').astype(float)
+        orders = pd.DataFrame({
+            'vendor': vendor,
+            'item_code': self._code_column(df, 'item_code'),
+            'description': self._text_column(df, 'description', upper=True),
+            'pack_size': self._text_column(df, 'pack_size'),
+            'case_price': case_price,
+            'unit_price': self._number_column(df, 'unit_price'),
+            'unit': self._text_column(df, 'unit', 'EACH', upper=True),
+            'category': self._text_column(df, 'category', 'UNCATEGORIZED', upper=True),
+            'last_updated': datetime.now()
+        }, index=df.index)
+
+        # Validate price - format messages only for the (few) bad rows,
+        # showing the cell as written when it was not a number
+        prices = case_price.to_numpy()
+        valid = prices > 0
+        bad = np.flatnonzero(~valid)
+        errors = [
+            f"Row {idx+2}: Invalid price ${cell if np.isnan(price) else price}"
+            for idx, price, cell in zip(
+                df.index.to_numpy()[bad].tolist(),
+                prices[bad].tolist(),
+                df['case_price'].to_numpy()[bad].tolist()
+            )
+        ]
+
+        return orders[valid], errors
+
+    @staticmethod
+    def _vendor_products_polars(df: 'pl.DataFrame', vendor: str, numeric_codes: bool = False):
+        """
+        Polars version of _vendor_products - one fused with_columns pass
+
+        Args:
+            df: Text columns from read_file_polars
+            vendor: Vendor name
+            numeric_codes: Read an all-numeric item_code column as numbers,
+                like pandas does for CSV files ('0012' -> '12')
+
+        Returns:
+            (products polars DataFrame, errors)
+        """
+        def text(column: str, default: str = '', upper: bool = False):
+            if column not in df.columns:
+                return pl.lit(default).alias(column)
+            expr = pl.col(column).cast(pl.Utf8).str.strip_chars()
+            if upper:
+                expr = expr.str.to_uppercase()
+            return expr.fill_null(default)
+
+        def code(column: str):
+            # Same text as _code_column - whole numbers without '.0'
+            if column not in df.columns:
+                return pl.lit('').alias(column)
+            expr = pl.col(column).str.strip_chars()
+            if numeric_codes:
+                numbers = df[column].str.strip_chars().cast(pl.Float64, strict=False)
+                if numbers.null_count() == df[column].null_count():
+                    value = expr.cast(pl.Float64)
+                    expr = (
+                        pl.when(value.is_finite() & (value == value.round()))
+                        .then(value.cast(pl.Int64).cast(pl.Utf8))
+                        .otherwise(value.cast(pl.Utf8))
+                    )
+            return expr.fill_null('').alias(column)
+
+        def number(column: str):
+            if column not in df.columns:
+                return pl.lit(None, dtype=pl.Float64).alias(column)
+            return pl.col(column).str.strip_chars().cast(pl.Float64, strict=False)
+
+        orders = df.select(
+            pl.col('_row'),
+            pl.lit(vendor).alias('vendor'),
+            code('item_code'),
+            text('description', upper=True),
+            text('pack_size'),
+            number('case_price'),
+            number('unit_price'),
+            text('unit', 'EACH', upper=True),
+            text('category', 'UNCATEGORIZED', upper=True),
+            pl.lit(datetime.now()).alias('last_updated'),
+            pl.col('case_price').alias('_price_cell')
+        )
+
+        # Validate price, showing the cell as written when it was not a number
+        valid = (pl.col('case_price') > 0).fill_null(False)
+        invalid = orders.filter(~valid)
+        errors = [
+            f"Row {row+2}: Invalid price ${price if price is not None else cell if cell is not None else float('nan')}"
+            for row, price, cell in zip(invalid['_row'], invalid['case_price'], invalid['_price_cell'])
+        ]
+
+        return orders.filter(valid).drop('_row', '_price_cell'), errors
+
+    @staticmethod
+    def _products_schema() -> 'pa.Schema':
+        """Fixed Arrow schema for order guide products, shared by both backends"""
+        return pa.schema([
+            ('vendor', pa.string()),
+            ('item_code', pa.string()),
+            ('description', pa.string()),
+            ('pack_size', pa.string()),
+            ('case_price', pa.float64()),
+            ('unit_price', pa.float64()),
+            ('unit', pa.string()),
+            ('category', pa.string()),
+            ('last_updated', pa.timestamp('us'))
+        ])
+
+    @staticmethod
+    def _products_table(orders: pd.DataFrame) -> 'pa.Table':
+        """Convert order guide products to a pyarrow Table with a fixed schema"""
+        return pa.Table.from_pandas(orders, schema=FileImporter._products_schema(), preserve_index=False)
+
     # ==================== INVOICE IMPORT ====================
 
     def import_invoice(
@@ -224,25 +711,41 @@ class FileImporter:
         order_date = df['order_date'].iloc[0] if 'order_date' in df.columns else datetime.now()
 
         # Process line items
-        line_items = []
-        total = 0
-
-        for idx, row in df.iterrows():
-            try:
-                item = {
-                    'item_code': str(row['item_code']).strip(),
-                    'description': str(row['description']).strip(),
-                    'quantity': int(row['quantity']),
-                    'unit_price': float(row['unit_price']),
-                    'extension': float(row['extension']),
-                    'pack_size': str(row.get('pack_size', '')) if 'pack_size' in row and pd.notna(row.get('pack_size')) else ''
-                }
-
-                line_items.append(item)
-                total += item['extension']
-
-            except Exception as e:
-                print(f"⚠️  Row {idx+2} error: {e}")
+        quantity = pd.to_numeric(df['quantity'], errors='coerce').astype(float)
+        unit_price = pd.to_numeric(df['unit_price'], errors='coerce').astype(float)
+        extension = pd.to_numeric(df['extension'], errors='coerce').astype(float)
+
+        invalid = quantity.isna() | unit_price.isna() | extension.isna()
+        for idx in df.index[invalid]:
+            print(f"⚠️  Row {idx+2} error: non-numeric quantity, unit_price or extension")
+
+        valid = ~invalid
+        items = pd.DataFrame({
+            'item_code': self._text_column(df, 'item_code'),
+            'description': self._text_column(df, 'description'),
+            'quantity': quantity,
+            'unit_price': unit_price,
+            'extension': extension,
+            'pack_size': self._text_column(df, 'pack_size', strip=False)
+        }, index=df.index)[valid]
+        items['quantity'] = items['quantity'].astype(int)
+
+        # Total and extension check run on plain float64 arrays
+        extensions = extension[valid].to_numpy(np.float64)
+        total = float(extensions.sum())
+
+        # Check the whole-number quantity that is stored, so a truncated
+        # 2.5 shows up as a mismatch instead of passing on the raw value
+        mismatched = self._extension_mismatches(
+            items['quantity'].to_numpy(np.float64),
+            unit_price[valid].to_numpy(np.float64),
+            extensions
+        )
+        mismatched_rows = [int(idx) + 2 for idx in items.index[mismatched]]
+        for row_number in mismatched_rows:
+            print(f"⚠️  Row {row_number}: quantity × unit_price does not match extension")
+
+        line_items = items.to_dict('records')
 
         result = {
             'success': True,
@@ -251,7 +754,8 @@ class FileImporter:
             'order_date': order_date,
             'line_items': line_items,
             'item_count': len(line_items),
-            'total_amount': total
+            'total_amount': total,
+            'extension_mismatches': mismatched_rows
         }
 
         print(f"✅ Imported invoice: {len(line_items)} items, Total: ${total:,.2f}")
@@ -285,35 +789,34 @@ class FileImporter:
                 'error': validation['message']
             }
 
-        # Group by recipe
-        recipes = {}
-
-        for idx, row in df.iterrows():
-            recipe_name = str(row['recipe_name']).strip()
-
-            if recipe_name not in recipes:
-                recipes[recipe_name] = {
-                    'name': recipe_name,
-                    'category': str(row.get('category', 'Uncategorized')) if 'category' in row and pd.notna(row.get('category')) else 'Uncategorized',
-                    'yield_amount': float(row.get('yield_amount', 1)) if 'yield_amount' in row and pd.notna(row.get('yield_amount')) else 1,
-                    'yield_unit': str(row.get('yield_unit', 'servings')) if 'yield_unit' in row and pd.notna(row.get('yield_unit')) else 'servings',
-                    'ingredients': []
-                }
-
-            # Add ingredient
-            ingredient = {
-                'name': str(row['ingredient']).strip(),
-                'quantity': float(row['quantity']),
-                'unit': str(row['unit']).strip(),
-                'prep_instruction': str(row.get('prep_instruction', '')) if 'prep_instruction' in row and pd.notna(row.get('prep_instruction')) else ''
-            }
+        rows = pd.DataFrame({
+            'recipe_name': self._text_column(df, 'recipe_name'),
+            'category': self._text_column(df, 'category', 'Uncategorized', strip=False),
+            'yield_amount': self._number_column(df, 'yield_amount', 1),
+            'yield_unit': self._text_column(df, 'yield_unit', 'servings', strip=False),
+            'name': self._text_column(df, 'ingredient'),
+            'quantity': pd.to_numeric(df['quantity'], errors='coerce').astype(float),
+            'unit': self._text_column(df, 'unit'),
+            'prep_instruction': self._text_column(df, 'prep_instruction', strip=False)
+        }, index=df.index)
+
+        # Group by recipe (hashed groupby, file order kept with sort=False)
+        grouped = rows.groupby('recipe_name', sort=False)
+        meta = grouped[['category', 'yield_amount', 'yield_unit']].first()
+        ingredients = {
+            recipe_name: group[['name', 'quantity', 'unit', 'prep_instruction']].to_dict('records')
+            for recipe_name, group in grouped
+        }
 
-            recipes[recipe_name]['ingredients'].append(ingredient)
+        recipes = [
+            {'name': recipe_name, **details, 'ingredients': ingredients[recipe_name]}
+            for recipe_name, details in meta.to_dict('index').items()
+        ]
 
         result = {
             'success': True,
             'recipes_imported': len(recipes),
-            'recipes': list(recipes.values())
+            'recipes': recipes
         }
 
         print(f"✅ Imported {len(recipes)} recipes")
@@ -342,25 +845,22 @@ class FileImporter:
                 'error': validation['message']
             }
 
-        menu_items = []
+        menu_price = pd.to_numeric(df['menu_price'], errors='coerce').astype(float)
 
-        for idx, row in df.iterrows():
-            try:
-                item = {
-                    'name': str(row['item_name']).strip(),
-                    'category': str(row['category']).strip(),
-                    'subcategory': str(row.get('subcategory', '')) if 'subcategory' in row and pd.notna(row.get('subcategory')) else '',
-                    'menu_price': float(row['menu_price']),
-                    'recipe_name': str(row.get('recipe_name', '')) if 'recipe_name' in row and pd.notna(row.get('recipe_name')) else '',
-                    'portion_size': str(row.get('portion_size', '')) if 'portion_size' in row and pd.notna(row.get('portion_size')) else '',
-                    'target_margin': float(row.get('target_margin', 0.45)) if 'target_margin' in row and pd.notna(row.get('target_margin')) else 0.45,
-                    'description': str(row.get('description', '')) if 'description' in row and pd.notna(row.get('description')) else ''
-                }
-
-                menu_items.append(item)
+        invalid = menu_price.isna()
+        for idx in df.index[invalid]:
+            print(f"⚠️  Row {idx+2} error: non-numeric menu_price")
 
-            except Exception as e:
-                print(f"⚠️  Row {idx+2} error: {e}")
+        menu_items = pd.DataFrame({
+            'name': self._text_column(df, 'item_name'),
+            'category': self._text_column(df, 'category'),
+            'subcategory': self._text_column(df, 'subcategory', strip=False),
+            'menu_price': menu_price,
+            'recipe_name': self._text_column(df, 'recipe_name', strip=False),
+            'portion_size': self._text_column(df, 'portion_size', strip=False),
+            'target_margin': self._number_column(df, 'target_margin', 0.45),
+            'description': self._text_column(df, 'description', strip=False)
+        }, index=df.index)[~invalid].to_dict('records')
 
         result = {
             'success': True,
@@ -408,7 +908,11 @@ class FileImporter:
         events = []
         errors = []
 
-        for idx, row in df.iterrows():
+        # itertuples avoids building a Series (and upcasting dtypes) per row
+        columns = list(df.columns)
+
+        for idx, *values in df.itertuples(name=None):
+            row = dict(zip(columns, values))
             try:
                 event = {
                     'event_name': str(row['event_name']).strip(),
@@ -483,6 +987,67 @@ class FileImporter:
 
         return result
 
+    # ==================== BATCH IMPORT ====================
+
+    def import_many(
+        self,
+        specs: List[Tuple[str, ...]],
+        output_dir: str,
+        max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Import several vendor order guides in parallel
+
+        Files are independent, so each one is imported in its own worker
+        process (threads for the polars backend, which releases the GIL).
+        Each worker writes its products to output_dir and sends back only
+        a summary of the import.
+
+        Args:
+            specs: (file_path, vendor) or (file_path, vendor, sheet_name) per file
+            output_dir: Directory to write each file's products to, as
+                <file name with extension>.parquet
+            max_workers: Number of workers (default: one per file, up to the CPU count)
+
+        Returns:
+            List of import results without products, in the same order as specs
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow/Parquet output - pip install pyarrow")
+
+        # Keep the extension so guide.csv and guide.xlsx don't share a file
+        output_paths = [str(Path(output_dir) / f"{Path(spec[0]).name}.parquet") for spec in specs]
+        duplicates = sorted(path for path, count in Counter(output_paths).items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Several files would be written to the same output: {duplicates}")
+
+        settings = (self.csv_engine, self.excel_engine, self.backend)
+        executor_class = ThreadPoolExecutor if self.backend == 'polars' else ProcessPoolExecutor
+        max_workers = max_workers or min(len(specs), os.cpu_count() or 1) or 1
+
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        print(f"📦 Importing {len(specs)} order guides in parallel")
+
+        with executor_class(max_workers=max_workers) as executor:
+            results = list(executor.map(_import_vendor_file, repeat(settings), specs, output_paths))
+
+        # Workers record history on their own copies - record it here
+        for spec, result in zip(specs, results):
+            if result['success']:
+                self.import_history.append({
+                    'timestamp': datetime.now(),
+                    'type': 'vendor_order_guide',
+                    'vendor': spec[1],
+                    'file': str(spec[0]),
+                    'rows_imported': result['products_imported']
+                })
+
+        succeeded = sum(1 for result in results if result['success'])
+        print(f"✅ Imported {succeeded}/{len(specs)} order guides")
+
+        return results
+
     # ==================== EXPORT TEMPLATES ====================
 
     def create_import_templates(self, output_dir: str = 'data/templates'):
@@ -498,82 +1063,78 @@ class FileImporter:
         os.makedirs(output_dir, exist_ok=True)
 
         # Vendor Order Guide Template
-        order_guide_template = pd.DataFrame({
-            'Item Code': ['SYS001', 'SYS002', 'SYS003'],
-            'Description': ['GROUND BEEF 80/20', 'BLACK PEPPER COARSE', 'ONION POWDER'],
-            'Pack Size': ['10 LB', '6/1LB', '6/1LB'],
-            'Case Price': [45.99, 298.95, 148.95],
-            'Unit Price': [4.599, 49.83, 24.83],
-            'Unit': ['LB', 'LB', 'LB'],
-            'Category': ['MEAT', 'SPICES', 'SPICES']
-        })
-        order_guide_template.to_csv(f'{output_dir}/vendor_order_guide_template.csv', index=False)
+        self._write_template(
+            f'{output_dir}/vendor_order_guide_template.csv',
+            ['Item Code', 'Description', 'Pack Size', 'Case Price', 'Unit Price', 'Unit', 'Category'],
+            [
+                ['SYS001', 'GROUND BEEF 80/20', '10 LB', 45.99, 4.599, 'LB', 'MEAT'],
+                ['SYS002', 'BLACK PEPPER COARSE', '6/1LB', 298.95, 49.83, 'LB', 'SPICES'],
+                ['SYS003', 'ONION POWDER', '6/1LB', 148.95, 24.83, 'LB', 'SPICES']
+            ]
+        )
 
         # Invoice Template
-        invoice_template = pd.DataFrame({
-            'Order Date': ['2025-01-18', '2025-01-18'],
-            'Invoice Number': ['INV-12345', 'INV-12345'],
-            'Item Code': ['SYS001', 'SYS002'],
-            'Description': ['GROUND BEEF 80/20', 'BLACK PEPPER COARSE'],
-            'Quantity': [5, 2],
-            'Unit Price': [45.99, 298.95],
-            'Extension': [229.95, 597.90],
-            'Pack Size': ['10 LB', '6/1LB']
-        })
-        invoice_template.to_csv(f'{output_dir}/invoice_template.csv', index=False)
+        self._write_template(
+            f'{output_dir}/invoice_template.csv',
+            ['Order Date', 'Invoice Number', 'Item Code', 'Description', 'Quantity',
+             'Unit Price', 'Extension', 'Pack Size'],
+            [
+                ['2025-01-18', 'INV-12345', 'SYS001', 'GROUND BEEF 80/20', 5, 45.99, 229.95, '10 LB'],
+                ['2025-01-18', 'INV-12345', 'SYS002', 'BLACK PEPPER COARSE', 2, 298.95, 597.90, '6/1LB']
+            ]
+        )
 
         # Recipe Template
-        recipe_template = pd.DataFrame({
-            'Recipe Name': ['BBQ Sauce', 'BBQ Sauce', 'BBQ Sauce', 'Green Chile', 'Green Chile'],
-            'Ingredient': ['Tomato Paste', 'Brown Sugar', 'Apple Cider Vinegar', 'Pork Shoulder', 'Green Chiles'],
-            'Quantity': [2, 1, 0.5, 5, 3],
-            'Unit': ['cups', 'cup', 'cup', 'lbs', 'cans'],
-            'Yield Amount': [1, 1, 1, 50, 50],
-            'Yield Unit': ['gallon', 'gallon', 'gallon', 'servings', 'servings'],
-            'Category': ['Sauce', 'Sauce', 'Sauce', 'Entree', 'Entree']
-        })
-        recipe_template.to_csv(f'{output_dir}/recipe_template.csv', index=False)
+        self._write_template(
+            f'{output_dir}/recipe_template.csv',
+            ['Recipe Name', 'Ingredient', 'Quantity', 'Unit', 'Yield Amount', 'Yield Unit', 'Category'],
+            [
+                ['BBQ Sauce', 'Tomato Paste', 2.0, 'cups', 1, 'gallon', 'Sauce'],
+                ['BBQ Sauce', 'Brown Sugar', 1.0, 'cup', 1, 'gallon', 'Sauce'],
+                ['BBQ Sauce', 'Apple Cider Vinegar', 0.5, 'cup', 1, 'gallon', 'Sauce'],
+                ['Green Chile', 'Pork Shoulder', 5.0, 'lbs', 50, 'servings', 'Entree'],
+                ['Green Chile', 'Green Chiles', 3.0, 'cans', 50, 'servings', 'Entree']
+            ]
+        )
 
         # Menu Items Template
-        menu_template = pd.DataFrame({
-            'Item Name': ['Smothered Burrito', 'BBQ Pulled Pork', 'Green Chile Bowl'],
-            'Category': ['Entree', 'Entree', 'Entree'],
-            'Subcategory': ['Mexican', 'BBQ', 'Mexican'],
-            'Menu Price': [12.99, 10.99, 9.99],
-            'Recipe Name': ['Green Chile', 'BBQ Sauce', 'Green Chile'],
-            'Portion Size': ['12 oz', '8 oz', '10 oz'],
-            'Target Margin': [0.45, 0.45, 0.45]
-        })
-        menu_template.to_csv(f'{output_dir}/menu_items_template.csv', index=False)
+        self._write_template(
+            f'{output_dir}/menu_items_template.csv',
+            ['Item Name', 'Category', 'Subcategory', 'Menu Price', 'Recipe Name', 'Portion Size',
+             'Target Margin'],
+            [
+                ['Smothered Burrito', 'Entree', 'Mexican', 12.99, 'Green Chile', '12 oz', 0.45],
+                ['BBQ Pulled Pork', 'Entree', 'BBQ', 10.99, 'BBQ Sauce', '8 oz', 0.45],
+                ['Green Chile Bowl', 'Entree', 'Mexican', 9.99, 'Green Chile', '10 oz', 0.45]
+            ]
+        )
 
         # BEO / Catering Event Template
-        beo_template = pd.DataFrame({
-            'Event Name': ['Corporate Lunch', 'Birthday Party', 'Wedding Reception'],
-            'Event Type': ['Corporate', 'Birthday', 'Wedding'],
-            'Event Date': ['2025-02-15', '2025-03-10', '2025-04-20'],
-            'Start Time': ['11:30 AM', '6:00 PM', '5:00 PM'],
-            'End Time': ['2:00 PM', '10:00 PM', '11:00 PM'],
-            'Guest Count': [50, 25, 150],
-            'Customer Name': ['John Smith', 'Sarah Johnson', 'Mike & Emily Davis'],
-            'Customer Phone': ['970-555-1234', '970-555-5678', '970-555-9012'],
-            'Customer Email': ['john@company.com', 'sarah@email.com', 'mike@email.com'],
-            'Venue Name': ['The Lariat', 'The Lariat - Private Room', 'The Lariat - Full Venue'],
-            'Venue Location': ['Fort Collins, CO', 'Fort Collins, CO', 'Fort Collins, CO'],
-            'Menu Selection': ['BBQ Buffet', 'Taco Bar', 'Premium Dinner Service'],
-            'Special Requests': ['Vegetarian option for 5', 'Birthday cake table', 'Outdoor ceremony space'],
-            'Dietary Restrictions': ['2 Gluten-Free, 5 Vegetarian', '1 Vegan', '10 Vegetarian, 3 Gluten-Free'],
-            'Price Per Person': [25.00, 22.00, 45.00],
-            'Venue Fee': [500.00, 250.00, 2000.00],
-            'Service Fee': [125.00, 75.00, 500.00],
-            'Gratuity': [250.00, 137.50, 1350.00],
-            'Deposit Paid': [500.00, 200.00, 2000.00],
-            'Status': ['CONFIRMED', 'PENDING', 'CONFIRMED'],
-            'Approved': [1, 0, 1],
-            'Setup Instructions': ['Round tables of 8', 'U-shaped seating', 'Head table for wedding party'],
-            'Equipment Needed': ['Projector, Microphone', 'Sound system', 'DJ setup area, dance floor'],
-            'Staff Required': [3, 2, 8]
-        })
-        beo_template.to_csv(f'{output_dir}/beo_catering_events_template.csv', index=False)
+        self._write_template(
+            f'{output_dir}/beo_catering_events_template.csv',
+            ['Event Name', 'Event Type', 'Event Date', 'Start Time', 'End Time', 'Guest Count',
+             'Customer Name', 'Customer Phone', 'Customer Email', 'Venue Name', 'Venue Location',
+             'Menu Selection', 'Special Requests', 'Dietary Restrictions', 'Price Per Person',
+             'Venue Fee', 'Service Fee', 'Gratuity', 'Deposit Paid', 'Status', 'Approved',
+             'Setup Instructions', 'Equipment Needed', 'Staff Required'],
+            [
+                ['Corporate Lunch', 'Corporate', '2025-02-15', '11:30 AM', '2:00 PM', 50,
+                 'John Smith', '970-555-1234', 'john@company.com', 'The Lariat', 'Fort Collins, CO',
+                 'BBQ Buffet', 'Vegetarian option for 5', '2 Gluten-Free, 5 Vegetarian', 25.00,
+                 500.00, 125.00, 250.00, 500.00, 'CONFIRMED', 1,
+                 'Round tables of 8', 'Projector, Microphone', 3],
+                ['Birthday Party', 'Birthday', '2025-03-10', '6:00 PM', '10:00 PM', 25,
+                 'Sarah Johnson', '970-555-5678', 'sarah@email.com', 'The Lariat - Private Room',
+                 'Fort Collins, CO', 'Taco Bar', 'Birthday cake table', '1 Vegan', 22.00,
+                 250.00, 75.00, 137.50, 200.00, 'PENDING', 0,
+                 'U-shaped seating', 'Sound system', 2],
+                ['Wedding Reception', 'Wedding', '2025-04-20', '5:00 PM', '11:00 PM', 150,
+                 'Mike & Emily Davis', '970-555-9012', 'mike@email.com', 'The Lariat - Full Venue',
+                 'Fort Collins, CO', 'Premium Dinner Service', 'Outdoor ceremony space',
+                 '10 Vegetarian, 3 Gluten-Free', 45.00, 2000.00, 500.00, 1350.00, 2000.00,
+                 'CONFIRMED', 1, 'Head table for wedding party', 'DJ setup area, dance floor', 8]
+            ]
+        )
 
         print(f"✅ Created templates in {output_dir}/")
         print(f"   - vendor_order_guide_template.csv")
@@ -584,6 +1145,31 @@ class FileImporter:
 
         return output_dir
 
+    @staticmethod
+    def _write_template(path: str, headers: List[str], rows: List[List]):
+        """Write a small static template with csv.writer (no DataFrame needed)"""
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(headers)
+            writer.writerows(rows)
+
+
+def _import_vendor_file(settings: Tuple, spec: Tuple[str, ...], output_path: str) -> Dict:
+    """Worker for FileImporter.import_many - must be module level to pickle"""
+    file_path, vendor, *rest = spec
+    sheet_name = rest[0] if rest else None
+
+    # Products only go to output_path - none are kept to send back
+    try:
+        return FileImporter(*settings).import_vendor_order_guide(
+            file_path, vendor, sheet_name, as_dicts=None, output_path=output_path
+        )
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"{file_path}: {e}"
+        }
+
 
 # ==================== CLI USAGE ====================
 
@@ -599,6 +1185,7 @@ if __name__ == "__main__":
         print("\n📝 Templates created! Fill them out and import with:")
         print("   python -m modules.importers.file_importer import vendor data/sysco.csv SYSCO")
         print("   python -m modules.importers.file_importer import beo data/catering_events.csv")
+        print("   python -m modules.importers.file_importer import-batch data/order_guides SYSCO [output_dir]")
         sys.exit(0)
 
     command = sys.argv[1]
@@ -634,3 +1221,21 @@ if __name__ == "__main__":
             print(f"Results: {result}")
         else:
             print(f"\n❌ Import failed: {result.get('error')}")
+
+    elif command == 'import-batch':
+        directory = Path(sys.argv[2])
+        vendor = sys.argv[3] if len(sys.argv) > 3 else 'SYSCO'
+        output_dir = sys.argv[4] if len(sys.argv) > 4 else 'data/imports'
+
+        files = sorted(p for p in directory.iterdir() if p.suffix.lower() in importer.supported_formats)
+        if not files:
+            print(f"No importable files found in {directory}")
+            sys.exit(1)
+
+        results = importer.import_many([(str(path), vendor) for path in files], output_dir)
+
+        for path, result in zip(files, results):
+            if result['success']:
+                print(f"   ✅ {path.name}: {result['products_imported']} products -> {result['output_path']}")
+            else:
+                print(f"   ❌ {path.name}: {result.get('error')}")
@@ -59,10 +59,12 @@ class MenuItem:
             self.dietary_flags = []
         if self.allergens is None:
             self.allergens = []
-        if self.created_date is None:
-            self.created_date = datetime.now()
-        if self.last_modified is None:
-            self.last_modified = datetime.now()
+        if self.created_date is None or self.last_modified is None:
+            now = datetime.now()
+            if self.created_date is None:
+                self.created_date = now
+            if self.last_modified is None:
+                self.last_modified = now
         if not self.display_name:
             self.display_name = self.name
     
@@ -36,6 +36,7 @@ class OrderGuideManager:
         }
         """
         count = 0
+        loaded_at = datetime.now()  # one timestamp for the whole guide
         for item in data:
             self.sysco_catalog[item['item_code']] = {
                 'vendor': 'SYSCO',
@@ -45,11 +46,11 @@ class OrderGuideManager:
                 'unit_price': item.get('unit_price', 0),
                 'unit': item.get('unit', 'EACH'),
                 'category': item.get('category', 'UNCATEGORIZED'),
-                'last_updated': datetime.now()
+                'last_updated': loaded_at
             }
             count += 1
         
-        self.last_updated['sysco'] = datetime.now()
+        self.last_updated['sysco'] = loaded_at
         return count
     
     def load_shamrock_guide(self, data: List[Dict]) -> int:
@@ -59,6 +60,7 @@ class OrderGuideManager:
         Expected format matches SYSCO for consistency
         """
         count = 0
+        loaded_at = datetime.now()  # one timestamp for the whole guide
         for item in data:
             self.shamrock_catalog[item['item_code']] = {
                 'vendor': 'Shamrock Foods',
@@ -68,11 +70,11 @@ class OrderGuideManager:
                 'unit_price': item.get('unit_price', 0),
                 'unit': item.get('unit', 'EACH'),
                 'category': item.get('category', 'UNCATEGORIZED'),
-                'last_updated': datetime.now()
+                'last_updated': loaded_at
             }
             count += 1
         
-        self.last_updated['shamrock'] = datetime.now()
+        self.last_updated['shamrock'] = loaded_at
         return count
     
     def find_matching_products(self, threshold: float = 0.8) -> List[Dict]:
@@ -82,24 +84,47 @@ class OrderGuideManager:
         """
         matches = []
         
+        # Lowercase and split each description once up front rather than
+        # once per pair
+        shamrock_words = [
+            (sham_code, sham_item, frozenset(sham_item['description'].lower().split()))
+            for sham_code, sham_item in self.shamrock_catalog.items()
+        ]
+        
+        # With a positive threshold a pair needs at least one shared word, so
+        # an inverted word -> Shamrock position index narrows each SYSCO item
+        # to the products it could actually match
+        word_index = {}
+        if threshold > 0:
+            for position, (_, _, sham_words) in enumerate(shamrock_words):
+                for word in sham_words:
+                    word_index.setdefault(word, []).append(position)
+        
         # Simple matching based on description similarity
         # In production, you'd want fuzzy matching with libraries like fuzzywuzzy
         for sys_code, sys_item in self.sysco_catalog.items():
-            sys_desc = sys_item['description'].lower()
+            # Basic matching - check if key words match
+            sys_words = frozenset(sys_item['description'].lower().split())
             
-            for sham_code, sham_item in self.shamrock_catalog.items():
-                sham_desc = sham_item['description'].lower()
-                
-                # Basic matching - check if key words match
-                sys_words = set(sys_desc.split())
-                sham_words = set(sham_desc.split())
-                
-                # Calculate similarity
-                intersection = sys_words & sham_words
-                union = sys_words | sham_words
+            if threshold > 0:
+                # Sorted so matches keep catalog order
+                positions = sorted({
+                    position
+                    for word in sys_words
+                    for position in word_index.get(word, ())
+                })
+                candidates = [shamrock_words[position] for position in positions]
+            else:
+                candidates = shamrock_words
+            
+            for sham_code, sham_item, sham_words in candidates:
+                # Calculate similarity (Jaccard) - union size from the
+                # intersection, without building the union set
+                shared = len(sys_words & sham_words)
+                union_size = len(sys_words) + len(sham_words) - shared
                 
-                if union:
-                    similarity = len(intersection) / len(union)
+                if union_size:
+                    similarity = shared / union_size
                     
                     if similarity >= threshold:
                         matches.append({
@@ -158,11 +183,14 @@ class OrderGuideManager:
         
         return df
     
-    def get_category_analysis(self) -> Dict[str, Dict]:
+    def get_category_analysis(self, comparison_df: pd.DataFrame = None) -> Dict[str, Dict]:
         """
         Analyze pricing by category
+        
+        Args:
+            comparison_df: Result of compare_prices() to reuse (computed if omitted)
         """
-        df = self.compare_prices()
+        df = comparison_df if comparison_df is not None else self.compare_prices()
         
         if df.empty:
             return {}
@@ -186,14 +214,19 @@ class OrderGuideManager:
         
         return category_analysis
     
-    def generate_purchase_recommendation(self, weekly_usage: Dict[str, float] = None) -> Dict:
+    def generate_purchase_recommendation(
+        self,
+        weekly_usage: Dict[str, float] = None,
+        comparison_df: pd.DataFrame = None
+    ) -> Dict:
         """
         Generate purchasing recommendations based on price comparisons
         
         Args:
             weekly_usage: Dict mapping item descriptions to weekly usage amounts
+            comparison_df: Result of compare_prices() to reuse (computed if omitted)
         """
-        df = self.compare_prices()
+        df = comparison_df if comparison_df is not None else self.compare_prices()
         
         if df.empty:
             return {'error': 'No comparison data available'}
@@ -205,7 +238,7 @@ class OrderGuideManager:
                 'sysco_preferred': len(df[df['preferred_vendor'] == 'SYSCO']),
             },
             'top_10_savings': [],
-            'category_recommendations': self.get_category_analysis(),
+            'category_recommendations': self.get_category_analysis(df),
             'estimated_monthly_savings': 0
         }
         
@@ -233,11 +266,19 @@ class OrderGuideManager:
         
         return recommendations
     
-    def export_comparison(self, filepath: str = 'price_comparison.xlsx') -> str:
+    def export_comparison(
+        self,
+        filepath: str = 'price_comparison.xlsx',
+        comparison_df: pd.DataFrame = None
+    ) -> str:
         """
         Export price comparison to Excel file
+        
+        Args:
+            filepath: Output Excel path
+            comparison_df: Result of compare_prices() to reuse (computed if omitted)
         """
-        df = self.compare_prices()
+        df = comparison_df if comparison_df is not None else self.compare_prices()
         
         if df.empty:
             return "No data to export"
@@ -248,7 +289,7 @@ class OrderGuideManager:
             df.to_excel(writer, sheet_name='Price Comparison', index=False)
             
             # Category analysis sheet
-            cat_analysis = self.get_category_analysis()
+            cat_analysis = self.get_category_analysis(df)
             cat_df = pd.DataFrame.from_dict(cat_analysis, orient='index')
             cat_df.to_excel(writer, sheet_name='Category Analysis')
             
@@ -79,16 +79,15 @@ class RecipeIngredient:
     @property
     def cost(self) -> float:
         """Calculate cost for this ingredient in the recipe"""
-        if self.ingredient.preferred_vendor == "SYSCO" and self.ingredient.sysco_unit_price:
-            return self.quantity * self.ingredient.sysco_unit_price
-        elif self.ingredient.preferred_vendor == "Shamrock Foods" and self.ingredient.shamrock_unit_price:
-            return self.quantity * self.ingredient.shamrock_unit_price
-        # Fallback to whichever price is available
-        elif self.ingredient.sysco_unit_price:
-            return self.quantity * self.ingredient.sysco_unit_price
-        elif self.ingredient.shamrock_unit_price:
-            return self.quantity * self.ingredient.shamrock_unit_price
-        return 0.0
+        ing = self.ingredient
+        
+        # Preferred vendor's price first, then whichever price is available
+        if ing.preferred_vendor == "Shamrock Foods":
+            unit_price = ing.shamrock_unit_price or ing.sysco_unit_price
+        else:
+            unit_price = ing.sysco_unit_price or ing.shamrock_unit_price
+        
+        return self.quantity * unit_price if unit_price else 0.0
 
 
 @dataclass
@@ -131,10 +130,12 @@ class Recipe:
             self.prep_instructions = []
         if self.cooking_instructions is None:
             self.cooking_instructions = []
-        if self.created_date is None:
-            self.created_date = datetime.now()
-        if self.last_modified is None:
-            self.last_modified = datetime.now()
+        if self.created_date is None or self.last_modified is None:
+            now = datetime.now()
+            if self.created_date is None:
+                self.created_date = now
+            if self.last_modified is None:
+                self.last_modified = now
     
     @property
     def total_cost(self) -> float:
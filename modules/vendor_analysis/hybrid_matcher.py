@@ -9,6 +9,8 @@ This module provides the best of both worlds:
 - Integration with LariatBible Ingredient dataclass
 """
 
+import functools
+from collections import Counter
 import pandas as pd
 import re
 from typing import Dict, List, Optional, Tuple
@@ -18,6 +20,12 @@ from datetime import datetime
 
 from modules.recipes.recipe import Ingredient
 
+# Optional: Aho-Corasick automaton for one-pass spec keyword scanning
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # =====================================================
 # CONFIGURATION
@@ -113,23 +121,45 @@ class PackSizeParser:
 # SPECIFICATION VALIDATOR
 # =====================================================
 
+def _build_spec_automaton():
+    """Build an automaton over CRITICAL_SPECS, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for spec in MatchingConfig.CRITICAL_SPECS:
+        automaton.add_word(spec, spec)
+    automaton.make_automaton()
+    return automaton
+
+
 class SpecificationValidator:
     """Validates that product specifications match exactly"""
 
+    # Finds every spec keyword in a single scan of the description
+    SPEC_AUTOMATON = _build_spec_automaton()
+
     @staticmethod
     def extract_specifications(text: str) -> set:
         """Extract critical specification keywords from product description"""
+        return set(SpecificationValidator._spec_keywords(text))
+
+    # A Shamrock description is validated against every candidate SYSCO row,
+    # so the keyword scan is memoized per description
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _spec_keywords(text: str) -> frozenset:
+        """Cached, immutable form of extract_specifications"""
         if not text:
-            return set()
+            return frozenset()
 
         text = str(text).upper()
-        found_specs = set()
 
-        for spec in MatchingConfig.CRITICAL_SPECS:
-            if spec in text:
-                found_specs.add(spec)
+        automaton = SpecificationValidator.SPEC_AUTOMATON
+        if automaton is not None:
+            return frozenset(spec for _, spec in automaton.iter(text))
 
-        return found_specs
+        return frozenset(spec for spec in MatchingConfig.CRITICAL_SPECS if spec in text)
 
     @staticmethod
     def validate_match(shamrock_desc: str, sysco_desc: str) -> Tuple[bool, str]:
@@ -139,14 +169,14 @@ class SpecificationValidator:
         Returns:
             (is_valid, reason)
         """
-        sham_specs = SpecificationValidator.extract_specifications(shamrock_desc)
-        sysco_specs = SpecificationValidator.extract_specifications(sysco_desc)
+        sham_specs = SpecificationValidator._spec_keywords(shamrock_desc)
+        sysco_specs = SpecificationValidator._spec_keywords(sysco_desc)
 
         # If either has critical specs, they MUST match
         if sham_specs or sysco_specs:
             if sham_specs != sysco_specs:
-                missing_in_sysco = sham_specs - sysco_specs
-                missing_in_sham = sysco_specs - sham_specs
+                missing_in_sysco = set(sham_specs - sysco_specs)
+                missing_in_sham = set(sysco_specs - sham_specs)
 
                 reason = "SPECIFICATION MISMATCH: "
                 if missing_in_sysco:
@@ -198,7 +228,9 @@ class FuzzyMatcher:
         words1 = set(text1.split())
         words2 = set(text2.split())
         if words1 and words2:
-            overlap = len(words1 & words2) / len(words1 | words2)
+            # Union size from the intersection - no third set is built
+            shared = len(words1 & words2)
+            overlap = shared / (len(words1) + len(words2) - shared)
         else:
             overlap = 0
 
@@ -291,52 +323,81 @@ class HybridVendorMatcher:
         self.pack_parser = PackSizeParser()
         self.matches: List[MatchResult] = []
 
-    def find_best_match(self, shamrock_item: Dict, sysco_items: pd.DataFrame) -> Optional[MatchResult]:
+    def prepare_catalog(self, sysco_items: pd.DataFrame) -> Tuple[List, List[str], List[Optional[str]]]:
+        """
+        Clean every SYSCO description once for a matching run
+
+        Returns:
+            (descriptions, cleaned descriptions, pack info) in row order
+        """
+        if 'description' in sysco_items.columns:
+            descriptions = sysco_items['description'].tolist()
+        else:
+            descriptions = [''] * len(sysco_items)
+
+        cleaned = [self.fuzzy_matcher.clean_text(desc) for desc in descriptions]
+        pack_info = [self.fuzzy_matcher.extract_pack_info(desc) for desc in descriptions]
+        return descriptions, cleaned, pack_info
+
+    def find_best_match(
+        self,
+        shamrock_item: Dict,
+        sysco_items: pd.DataFrame,
+        catalog: Optional[Tuple[List, List[str], List[Optional[str]]]] = None
+    ) -> Optional[MatchResult]:
         """
         Find best SYSCO match for a Shamrock item with validation
 
         Args:
             shamrock_item: Dict with keys: sku, description, price, pack
             sysco_items: DataFrame with SYSCO products
+            catalog: Output of prepare_catalog(sysco_items); built here when
+                not given, so pass it in when matching many items
 
         Returns:
             MatchResult or None if no valid match found
         """
+        if catalog is None:
+            catalog = self.prepare_catalog(sysco_items)
+        descriptions, sysco_cleaned, sysco_pack_infos = catalog
+
         sham_clean = self.fuzzy_matcher.clean_text(shamrock_item['description'])
+        sham_pack_info = self.fuzzy_matcher.extract_pack_info(shamrock_item['description'])
 
         best_match = None
         best_score = 0
 
-        for _, sysco_row in sysco_items.iterrows():
-            sysco_clean = self.fuzzy_matcher.clean_text(sysco_row.get('description', ''))
+        # Highest score any row can reach - once found, nothing can beat it
+        max_score = 1.0 + (0.10 if sham_pack_info else 0.0)
 
+        for position, (sysco_clean, sysco_pack_info) in enumerate(zip(sysco_cleaned, sysco_pack_infos)):
             # Calculate fuzzy similarity
             similarity = self.fuzzy_matcher.calculate_similarity(sham_clean, sysco_clean)
 
             # Bonus for matching pack info in description
-            sham_pack_info = self.fuzzy_matcher.extract_pack_info(shamrock_item['description'])
-            sysco_pack_info = self.fuzzy_matcher.extract_pack_info(sysco_row.get('description', ''))
             if sham_pack_info and sysco_pack_info and sham_pack_info == sysco_pack_info:
                 similarity += 0.10
 
-            # Only consider if meets minimum threshold
-            if similarity < MatchingConfig.LOW_CONFIDENCE:
+            # Only consider if meets minimum threshold and beats the current best
+            if similarity < MatchingConfig.LOW_CONFIDENCE or similarity <= best_score:
                 continue
 
-            # CRITICAL: Validate specifications
+            # CRITICAL: Validate specifications (only for the new best candidate)
             is_valid, reason = self.spec_validator.validate_match(
                 shamrock_item['description'],
-                sysco_row.get('description', '')
+                descriptions[position]
             )
 
-            if similarity > best_score:
-                best_score = similarity
-                best_match = {
-                    'sysco_row': sysco_row,
-                    'similarity': similarity,
-                    'validation_status': 'PASS' if is_valid else 'FAIL',
-                    'validation_reason': reason
-                }
+            best_score = similarity
+            best_match = {
+                'sysco_row': sysco_items.iloc[position],
+                'similarity': similarity,
+                'validation_status': 'PASS' if is_valid else 'FAIL',
+                'validation_reason': reason
+            }
+
+            if best_score >= max_score:
+                break
 
         if not best_match:
             return None
@@ -414,6 +475,9 @@ class HybridVendorMatcher:
         print(f"\n🔄 Matching {total} Shamrock items against {len(sysco_df)} SYSCO items...")
         print("   Using hybrid fuzzy + specification validation...")
 
+        # Clean the SYSCO catalog once for the whole run
+        catalog = self.prepare_catalog(sysco_df)
+
         for idx, (_, sham_row) in enumerate(shamrock_df.iterrows(), 1):
             # Extract Shamrock info
             shamrock_item = {
@@ -424,7 +488,7 @@ class HybridVendorMatcher:
             }
 
             # Find best match
-            match_result = self.find_best_match(shamrock_item, sysco_df)
+            match_result = self.find_best_match(shamrock_item, sysco_df, catalog)
 
             if match_result:
                 results.append(match_result)
@@ -439,12 +503,13 @@ class HybridVendorMatcher:
         self.matches = results
 
         # Print summary
+        confidence_counts = Counter(m.confidence for m in results)
         print(f"\n✅ Matching complete!")
         print(f"   Total matches: {len(results)}")
-        print(f"   High confidence: {sum(1 for m in results if m.confidence == 'HIGH')}")
-        print(f"   Medium confidence: {sum(1 for m in results if m.confidence == 'MEDIUM')}")
-        print(f"   Low confidence: {sum(1 for m in results if m.confidence == 'LOW')}")
-        print(f"   Rejected (spec mismatch): {sum(1 for m in results if m.confidence == 'REJECTED')}")
+        print(f"   High confidence: {confidence_counts['HIGH']}")
+        print(f"   Medium confidence: {confidence_counts['MEDIUM']}")
+        print(f"   Low confidence: {confidence_counts['LOW']}")
+        print(f"   Rejected (spec mismatch): {confidence_counts['REJECTED']}")
 
         return results
 
@@ -508,23 +573,35 @@ class HybridVendorMatcher:
 
     def get_savings_summary(self) -> Dict:
         """Calculate total savings potential"""
-        approved_matches = [m for m in self.matches
-                          if m.confidence in ['HIGH', 'MEDIUM']
-                          and m.validation_status == 'PASS'
-                          and m.savings_per_lb is not None]
+        approved_matches = 0
+        items_with_savings = 0
+        total_savings_per_lb = 0
+        total_savings_percent = 0
+
+        # Accumulate every statistic in one pass over the matches
+        for m in self.matches:
+            if (m.confidence not in ('HIGH', 'MEDIUM')
+                    or m.validation_status != 'PASS'
+                    or m.savings_per_lb is None):
+                continue
+
+            approved_matches += 1
+            if m.savings_per_lb > 0:
+                items_with_savings += 1
+                total_savings_per_lb += m.savings_per_lb
+                total_savings_percent += m.savings_percent
 
         if not approved_matches:
             return {'error': 'No approved matches with pricing data'}
 
-        total_savings_per_lb = sum(m.savings_per_lb for m in approved_matches if m.savings_per_lb > 0)
-        avg_savings_percent = sum(m.savings_percent for m in approved_matches if m.savings_per_lb > 0) / len([m for m in approved_matches if m.savings_per_lb > 0]) if approved_matches else 0
+        avg_savings_percent = total_savings_percent / items_with_savings if items_with_savings else 0
 
         # Estimate monthly savings (assuming 10 lbs per product per month)
         estimated_monthly = total_savings_per_lb * 10
 
         return {
-            'approved_matches': len(approved_matches),
-            'items_with_savings': sum(1 for m in approved_matches if m.savings_per_lb > 0),
+            'approved_matches': approved_matches,
+            'items_with_savings': items_with_savings,
             'total_savings_per_lb': total_savings_per_lb,
             'average_savings_percent': avg_savings_percent,
             'estimated_monthly_savings': estimated_monthly,